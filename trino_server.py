@@ -7,16 +7,22 @@ to Trino databases for data engineers and analysts using AI tools.
 """
 import os
 import sys
+import asyncio
+import functools
+import hashlib
+import inspect
 import logging
-from typing import Optional, Tuple
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import NamedTuple, Optional, Tuple, Union
 from datetime import datetime, timezone
 from decimal import Decimal
-import httpx
+from operator import itemgetter
+from cachetools import TTLCache
 from mcp.server.fastmcp import FastMCP
 import trino
-from trino.auth import BasicAuthentication
-import pandas as pd
-from tabulate import tabulate
 import json
 import re
 
@@ -40,6 +46,16 @@ TRINO_PASSWORD = os.environ.get("TRINO_PASSWORD")  # Optional
 TRINO_USE_HTTPS = os.environ.get("TRINO_USE_HTTPS", "false").lower() == "true"
 TRINO_CATALOG = os.environ.get("TRINO_CATALOG", "tpch")
 TRINO_SCHEMA = os.environ.get("TRINO_SCHEMA", "tiny")
+TRINO_POOL_SIZE = int(os.environ.get("TRINO_POOL_SIZE", "8"))
+
+# Result cache configuration (TTL in seconds, 0 disables the cache)
+METADATA_CACHE_TTL = int(os.environ.get("METADATA_CACHE_TTL", "300"))
+QUERY_CACHE_TTL = int(os.environ.get("QUERY_CACHE_TTL", "60"))
+
+# Upper bound on the raw size of cell data fetched for a single result
+RESULT_MAX_BYTES = int(os.environ.get("RESULT_MAX_BYTES", "256000"))
+# Results larger than this are rendered without grid borders to keep responses small
+RESULT_COMPACT_BYTES = int(os.environ.get("RESULT_COMPACT_BYTES", "64000"))
 
 # PII Masking Configuration
 PII_MASKING_ENABLED = os.environ.get("PII_MASKING_ENABLED", "true").lower() == "true"
@@ -49,25 +65,9 @@ PII_MASK_STYLE = os.environ.get("PII_MASK_STYLE", "partial").lower()  # "full" o
 
 # === UTILITY FUNCTIONS ===
 
-def format_error_message(error: Exception, context: str = "") -> str:
-    """
-    Format error messages with helpful troubleshooting information.
-    
-    Args:
-        error: The exception that occurred
-        context: Additional context about what was being attempted
-        
-    Returns:
-        Formatted error message with troubleshooting hints
-    """
-    error_msg = str(error)
-    error_type = type(error).__name__
-    
-    # Connection errors
-    if "connection" in error_msg.lower() or "connect" in error_msg.lower():
-        return f"""❌ Connection Error: Cannot connect to Trino server
-
-Details: {error_msg}
+# Troubleshooting text only depends on configuration, so it is built once at
+# import and error messages just splice in the details of each failure.
+_CONNECTION_ERROR_HINTS = f"""
 
 Troubleshooting:
 1. Verify Trino server is running:
@@ -86,43 +86,65 @@ Troubleshooting:
    - Check Docker network mode settings
 
 5. Check firewall rules and network connectivity"""
-    
-    # Authentication errors
-    if "authentication" in error_msg.lower() or "unauthorized" in error_msg.lower():
-        return f"""❌ Authentication Error: Failed to authenticate with Trino
 
-Details: {error_msg}
+_AUTH_ERROR_HINTS = f"""
 
 Troubleshooting:
 1. Verify TRINO_USER is correct: {TRINO_USER}
 2. If using password authentication, check TRINO_PASSWORD is set correctly
 3. Verify user has read permissions on catalog: {TRINO_CATALOG}
 4. Check Trino server authentication configuration"""
-    
-    # Query errors
-    if "syntax" in error_msg.lower() or "parse" in error_msg.lower():
-        return f"""❌ Query Error: SQL syntax or parsing error
 
-Details: {error_msg}
+_QUERY_ERROR_HINTS = """
 
 Troubleshooting:
 1. Check SQL syntax for Trino-specific requirements
 2. Verify table/schema/catalog names are correct
 3. Ensure proper quoting for identifiers with special characters
 4. Check Trino SQL documentation for supported syntax"""
-    
-    # Generic error
-    return f"""❌ Error: {error_type}
-
-Details: {error_msg}
 
-Context: {context if context else 'No additional context'}
+_GENERIC_ERROR_HINTS = """
 
 For more help, check:
 - Trino server logs
 - Network connectivity
 - Environment variable configuration"""
 
+# (header, hints) per error category, checked in priority order
+_ERROR_TEMPLATES = {
+    'connection': ("❌ Connection Error: Cannot connect to Trino server\n\nDetails: ", _CONNECTION_ERROR_HINTS),
+    'auth': ("❌ Authentication Error: Failed to authenticate with Trino\n\nDetails: ", _AUTH_ERROR_HINTS),
+    'query': ("❌ Query Error: SQL syntax or parsing error\n\nDetails: ", _QUERY_ERROR_HINTS),
+}
+_ERROR_CATEGORY_RE = re.compile(
+    r'(?P<connection>connect)|(?P<auth>authentication|unauthorized)|(?P<query>syntax|parse)',
+    re.IGNORECASE,
+)
+
+
+def format_error_message(error: Exception, context: str = "") -> str:
+    """
+    Format error messages with helpful troubleshooting information.
+    
+    Args:
+        error: The exception that occurred
+        context: Additional context about what was being attempted
+        
+    Returns:
+        Formatted error message with troubleshooting hints
+    """
+    error_msg = str(error)
+    
+    # Connection errors take precedence over authentication, then query errors
+    categories = {match.lastgroup for match in _ERROR_CATEGORY_RE.finditer(error_msg)}
+    for category, (header, hints) in _ERROR_TEMPLATES.items():
+        if category in categories:
+            return header + error_msg + hints
+    
+    # Generic error
+    return (f"❌ Error: {type(error).__name__}\n\nDetails: {error_msg}\n\n"
+            f"Context: {context if context else 'No additional context'}{_GENERIC_ERROR_HINTS}")
+
 
 def get_trino_connection():
     """
@@ -141,6 +163,7 @@ def get_trino_connection():
         # Set up authentication if password is provided
         auth = None
         if TRINO_PASSWORD:
+            from trino.auth import BasicAuthentication
             auth = BasicAuthentication(TRINO_USER, TRINO_PASSWORD)
             logger.debug("Using BasicAuthentication")
         
@@ -163,52 +186,220 @@ def get_trino_connection():
         logger.error(f"Failed to connect to Trino: {e}")
         raise Exception(format_error_message(e, "Connection attempt"))
 
-def validate_query(query: str) -> bool:
-    """Validate that query is read-only (SELECT, SHOW, DESCRIBE only)."""
-    # Clean up the query - remove comments and normalize whitespace
-    query_clean = re.sub(r'--.*$', '', query, flags=re.MULTILINE)  # Remove SQL comments
-    query_clean = re.sub(r'/\*.*?\*/', '', query_clean, flags=re.DOTALL)  # Remove multi-line comments
-    query_clean = ' '.join(query_clean.split())  # Normalize whitespace
-    query_upper = query_clean.upper()
+
+class _ConnectionPool:
+    """
+    LIFO pool of idle Trino connections, reused across tool calls.
+    
+    Each connection owns a keep-alive HTTP session, so reusing the
+    connection avoids a fresh TCP (and TLS) handshake per tool call.
+    """
+
+    def __init__(self, maxsize: int):
+        # queue treats maxsize <= 0 as unbounded, so track "no reuse" ourselves
+        self._maxsize = maxsize
+        self._idle = queue.LifoQueue(maxsize=max(maxsize, 0))
+
+    def acquire(self):
+        """Return an idle connection, or open a new one if none is available."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return get_trino_connection()
+
+    def release(self, conn) -> None:
+        """Return a healthy connection to the pool, closing it if the pool is full or disabled."""
+        if self._maxsize <= 0:
+            conn.close()
+            return
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+
+_pool = _ConnectionPool(maxsize=TRINO_POOL_SIZE)
+
+
+@contextmanager
+def trino_conn():
+    """
+    Borrow a pooled Trino connection for the duration of a ``with`` block.
+    
+    The connection is returned to the pool on normal exit and closed if
+    the block raises, so a broken connection is never handed out again.
+    """
+    conn = _pool.acquire()
+    try:
+        yield conn
+    except BaseException:
+        conn.close()
+        raise
+    else:
+        _pool.release(conn)
+
+
+@contextmanager
+def trino_cursor():
+    """
+    Open a cursor on a pooled connection, guaranteeing both are released.
     
-    # List of write operations that should be blocked
-    # Using word boundaries to avoid false positives
-    forbidden_patterns = [
-        r'\bINSERT\s+INTO\b',
-        r'\bUPDATE\s+\w+\s+SET\b',
-        r'\bDELETE\s+FROM\b',
-        r'\bCREATE\s+(TABLE|VIEW|SCHEMA|DATABASE)\b',
-        r'\bDROP\s+(TABLE|VIEW|SCHEMA|DATABASE)\b',
-        r'\bALTER\s+(TABLE|VIEW|SCHEMA|DATABASE)\b',
-        r'\bMERGE\s+INTO\b',
-        r'\bTRUNCATE\s+TABLE\b',
-        r'\bGRANT\s+\w+\s+ON\b',
-        r'\bREVOKE\s+\w+\s+ON\b'
-    ]
+    The cursor is always closed (cancelling any query still running on
+    it), and the connection goes back to the pool only if no error occurred.
+    """
+    with trino_conn() as conn:
+        cursor = conn.cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+
+# Write operations that should be blocked, using word boundaries to avoid
+# false positives. Fused into a single alternation so validation is one scan.
+_FORBIDDEN_PATTERNS = [
+    r'\bINSERT\s+INTO\b',
+    r'\bUPDATE\s+\w+\s+SET\b',
+    r'\bDELETE\s+FROM\b',
+    r'\bCREATE\s+(TABLE|VIEW|SCHEMA|DATABASE)\b',
+    r'\bDROP\s+(TABLE|VIEW|SCHEMA|DATABASE)\b',
+    r'\bALTER\s+(TABLE|VIEW|SCHEMA|DATABASE)\b',
+    r'\bMERGE\s+INTO\b',
+    r'\bTRUNCATE\s+TABLE\b',
+    r'\bGRANT\s+\w+\s+ON\b',
+    r'\bREVOKE\s+\w+\s+ON\b'
+]
+_FORBIDDEN_RE = re.compile("|".join(f"(?:{p})" for p in _FORBIDDEN_PATTERNS))
+# Tokens for comment/whitespace normalization. Quoted literals and identifiers
+# are matched whole (with doubled-quote escapes) so their contents stay intact.
+_SQL_TOKEN_RE = re.compile(
+    r"""'[^']*(?:''[^']*)*'|"[^"]*(?:""[^"]*)*"|--[^\n]*|/\*.*?\*/|\s+|[^'"\s/-]+|.""",
+    re.DOTALL,
+)
+_LEADING_PARENS_RE = re.compile(r'^\s*\(+\s*')
+_ALLOWED_STARTS = ('SELECT', 'WITH', 'SHOW', 'DESCRIBE', 'DESC', 'EXPLAIN', 'VALUES')
+
+
+def _normalize_sql(query: str) -> Optional[str]:
+    """
+    Strip comments, collapse whitespace and drop trailing semicolons.
+    
+    Quoted literals and identifiers are kept verbatim, so queries that differ
+    only inside quotes never normalize to the same text.
+    
+    Returns:
+        The normalized query, or None if a quote or block comment is unterminated
+    """
+    parts = []
+    pending_space = False
+    for match in _SQL_TOKEN_RE.finditer(query):
+        token = match.group()
+        if token in ("'", '"') or (token == '/' and query.startswith('/*', match.start())):
+            return None
+        if token[0].isspace() or token.startswith(('--', '/*')):
+            pending_space = True
+            continue
+        if pending_space and parts:
+            parts.append(' ')
+        pending_space = False
+        parts.append(token)
+    return ''.join(parts).rstrip('; ')
+
+
+def validate_query(query: str) -> Tuple[bool, Optional[str]]:
+    """
+    Validate that query is read-only (SELECT, SHOW, DESCRIBE only).
+    
+    Returns:
+        Tuple of (is_valid, normalized) where normalized is the query with
+        comments, redundant whitespace and trailing semicolons removed, or
+        None if the query has an unterminated quote or comment
+    """
+    # Clean up the query - remove comments and normalize whitespace outside quotes.
+    # Unbalanced queries are checked as written, since their comments are ambiguous.
+    normalized = _normalize_sql(query)
+    query_clean = normalized if normalized is not None else ' '.join(query.split())
+    query_upper = query_clean.upper()
     
     # Check for forbidden patterns
-    for pattern in forbidden_patterns:
-        if re.search(pattern, query_upper):
-            logger.warning(f"Query blocked - matched forbidden pattern: {pattern}")
-            return False
+    match = _FORBIDDEN_RE.search(query_upper)
+    if match:
+        logger.warning(f"Query blocked - matched forbidden pattern: {match.group(0)}")
+        return False, normalized
     
     # Check if query starts with allowed keywords (after removing whitespace)
     query_trimmed = query_upper.strip()
-    allowed_starts = ['SELECT', 'WITH', 'SHOW', 'DESCRIBE', 'DESC', 'EXPLAIN', 'VALUES']
     
     # Also allow parentheses at the start (for CTEs or subqueries)
     if query_trimmed.startswith('('):
         # Look for the first non-parenthesis keyword
-        inner_query = re.sub(r'^\s*\(+\s*', '', query_trimmed)
-        if not any(inner_query.startswith(keyword) for keyword in allowed_starts):
-            logger.warning(f"Query blocked - doesn't start with allowed keyword")
-            return False
-    elif not any(query_trimmed.startswith(keyword) for keyword in allowed_starts):
+        query_trimmed = _LEADING_PARENS_RE.sub('', query_trimmed)
+    
+    if not query_trimmed.startswith(_ALLOWED_STARTS):
         logger.warning(f"Query blocked - doesn't start with allowed keyword")
-        return False
+        return False, normalized
     
     logger.debug(f"Query validated successfully")
-    return True
+    return True, normalized
+
+# Maximum rows execute_query returns; pushed into the query itself when possible
+QUERY_ROW_LIMIT = 100
+
+_TRAILING_LIMIT_RE = re.compile(
+    r'\b(?:LIMIT\s+(?:\d+|ALL)|FETCH\s+(?:FIRST|NEXT)\s+(?:\d+\s+)?ROWS?\s+(?:ONLY|WITH\s+TIES))\s*$',
+    re.IGNORECASE,
+)
+
+
+def apply_row_limit(query: str, normalized: Optional[str], limit: int = QUERY_ROW_LIMIT) -> str:
+    """
+    Append a LIMIT to SELECT/WITH queries that do not already end with one.
+    
+    Trino otherwise produces and streams every result page even though only
+    the first rows are displayed. The LIMIT is appended rather than wrapping
+    the query in a subquery, because Trino discards ORDER BY in subqueries.
+    
+    Args:
+        query: The original query text
+        normalized: The normalized query returned by validate_query, or None
+            if the query is ambiguous (it is then left unchanged)
+        limit: Row limit to apply
+        
+    Returns:
+        The query to execute
+    """
+    if normalized is None:
+        return query
+    if not normalized.upper().startswith(('SELECT', 'WITH')) or _TRAILING_LIMIT_RE.search(normalized):
+        return query
+    # Newline keeps the LIMIT outside any trailing line comment
+    return f"{query.rstrip().rstrip(';')}\nLIMIT {limit}"
+
+
+# Any non-empty name without control characters is accepted; quoting handles
+# the rest, so names Trino reports (e.g. with hyphens) can be passed back in
+_IDENT_RE = re.compile(r'^[^\x00-\x1f\x7f]{1,128}$')
+
+
+def _q(name: str) -> str:
+    """
+    Validate an identifier and return it double-quoted for use in SQL.
+    
+    Raises:
+        ValueError: If the name is empty, too long or contains control characters
+    """
+    if not _IDENT_RE.match(name):
+        raise ValueError(f"Invalid identifier: {name!r}")
+    return _quote_identifier(name)
+
+
+def _quote_identifier(name: str) -> str:
+    """Double-quote an identifier, escaping embedded quotes."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _qualified_name(*parts: str) -> str:
+    """Quote and join identifiers into a dotted name (e.g. catalog.schema.table)."""
+    return ".".join(_q(part) for part in parts)
 
 # === PII MASKING FUNCTIONS ===
 
@@ -379,53 +570,168 @@ def mask_cell_value(value, pii_type: str = None) -> str:
         return str_value[0] + "[****]" + str_value[-1]
 
 
-def mask_pii_in_dataframe(df: pd.DataFrame, columns: list) -> tuple:
+def mask_pii_in_rows(rows: list, columns: tuple) -> tuple:
     """
-    Apply PII masking to a DataFrame.
+    Apply PII masking to result rows in place.
     
     Args:
-        df: The pandas DataFrame to mask
-        columns: List of column names
+        rows: List of rows, each a list of string cell values
+        columns: Column names
         
     Returns:
-        Tuple of (masked_df, masked_columns_summary)
+        Tuple of (masked_rows, masked_columns_summary)
     """
     masked_columns = {}
-    df_masked = df.copy()
     
-    for col in columns:
+    for idx, col in enumerate(columns):
         # Layer 1: Check if column name indicates PII
         is_pii, pii_type = is_pii_column(col)
         
         if is_pii:
             # Mask entire column
-            df_masked[col] = df_masked[col].apply(lambda x: mask_cell_value(x, pii_type))
+            for row in rows:
+                row[idx] = mask_cell_value(row[idx], pii_type)
             masked_columns[col] = pii_type
             logger.debug(f"Masked column '{col}' (type: {pii_type}) based on column name")
         else:
             # Layer 2: Scan cell values for PII patterns
-            # Only scan string columns to avoid performance issues
-            if df_masked[col].dtype == 'object':
-                cells_with_pii = 0
-                detected_type = None
-                
-                # Sample first few rows to detect pattern
-                sample_size = min(10, len(df_masked))
-                for idx in range(sample_size):
-                    cell_value = df_masked[col].iloc[idx]
-                    if cell_value is not None:
-                        detected = scan_for_pii_patterns(str(cell_value))
-                        if detected:
-                            cells_with_pii += 1
-                            detected_type = detected
-                
-                # If significant portion of sample has PII, mask the column
-                if cells_with_pii >= 2 or (sample_size <= 3 and cells_with_pii >= 1):
-                    df_masked[col] = df_masked[col].apply(lambda x: mask_cell_value(x, detected_type))
-                    masked_columns[col] = f"{detected_type} (content)"
-                    logger.debug(f"Masked column '{col}' (type: {detected_type}) based on content scan")
-    
-    return df_masked, masked_columns
+            cells_with_pii = 0
+            detected_type = None
+            
+            # Sample first few rows to detect pattern
+            sample_size = min(10, len(rows))
+            for row in rows[:sample_size]:
+                detected = scan_for_pii_patterns(row[idx])
+                if detected:
+                    cells_with_pii += 1
+                    detected_type = detected
+            
+            # If significant portion of sample has PII, mask the column
+            if cells_with_pii >= 2 or (sample_size <= 3 and cells_with_pii >= 1):
+                for row in rows:
+                    row[idx] = mask_cell_value(row[idx], detected_type)
+                masked_columns[col] = f"{detected_type} (content)"
+                logger.debug(f"Masked column '{col}' (type: {detected_type}) based on content scan")
+    
+    return rows, masked_columns
+
+
+_FETCH_CHUNK_SIZE = 64
+
+# Column name from a cursor.description entry
+_first = itemgetter(0)
+
+
+def _fetch_rows(cursor, row_limit: int, byte_limit: int = RESULT_MAX_BYTES) -> Tuple[list, int]:
+    """
+    Fetch rows in small chunks, stopping at a row or byte limit.
+    
+    Args:
+        cursor: Database cursor with query results
+        row_limit: Maximum number of rows to fetch
+        byte_limit: Approximate maximum size of fetched cell data
+        
+    Returns:
+        Tuple of (rows, total_bytes) where total_bytes is the approximate
+        size of the fetched cell data
+    """
+    rows = []
+    total_bytes = 0
+    while len(rows) < row_limit:
+        chunk = cursor.fetchmany(min(_FETCH_CHUNK_SIZE, row_limit - len(rows)))
+        if not chunk:
+            break
+        for row in chunk:
+            rows.append(row)
+            total_bytes += sum(len(str(v)) for v in row)
+            if total_bytes >= byte_limit:
+                return rows, total_bytes
+    return rows, total_bytes
+
+
+@functools.lru_cache(maxsize=None)
+def _tabulate():
+    """Import tabulate on first use so server startup does not pay for it."""
+    from tabulate import tabulate
+    return tabulate
+
+
+def format_rows(columns: tuple, rows: list, limit: int = 100, total_bytes: int = 0) -> str:
+    """
+    Format fetched rows as a readable table.
+    
+    Args:
+        columns: Column names
+        rows: Rows fetched from the cursor
+        limit: Row limit the rows were fetched with
+        total_bytes: Approximate size of the fetched cell data
+        
+    Returns:
+        Formatted table string with result count
+    """
+    if not rows:
+        return "No results returned"
+    
+    # Convert rows to lists of display strings, handling special types.
+    # None becomes an empty string for tabulate compatibility.
+    processed_rows = []
+    for row in rows:
+        processed_row = []
+        for val in row:
+            try:
+                if val is None:
+                    processed_row.append("")
+                elif isinstance(val, Decimal):
+                    # Handle Decimal type (common in Trino)
+                    processed_row.append(str(val))
+                elif hasattr(val, 'isoformat'):
+                    # Handle datetime, date, time objects
+                    processed_row.append(val.isoformat())
+                elif isinstance(val, (bytes, bytearray)):
+                    # Handle binary data
+                    processed_row.append(f"<binary:{len(val)} bytes>")
+                else:
+                    # Handle basic types, arrays, maps and anything else
+                    processed_row.append(str(val))
+            except Exception as e:
+                logger.warning(f"Error converting value {type(val)}: {e}")
+                processed_row.append(f"<error: {type(val).__name__}>")
+        processed_rows.append(processed_row)
+    
+    # Apply PII masking if enabled
+    masked_columns = {}
+    if PII_MASKING_ENABLED:
+        processed_rows, masked_columns = mask_pii_in_rows(processed_rows, columns)
+        if masked_columns:
+            logger.info(f"PII masking applied to columns: {list(masked_columns.keys())}")
+    
+    # Format as table with column width limits; large results drop the grid
+    # borders, which otherwise add several bytes per cell to the response
+    compact = total_bytes > RESULT_COMPACT_BYTES
+    if len(processed_rows) == 1 and len(columns) <= 4:
+        # A single narrow row reads fine as plain text and skips tabulate entirely
+        table = " | ".join(columns) + "\n" + " | ".join(processed_rows[0])
+    else:
+        table = _tabulate()(processed_rows, headers=columns, tablefmt='plain' if compact else 'grid', maxcolwidths=50)
+    
+    result_count = len(rows)
+    total_msg = f"\n\nShowing {result_count} row(s)"
+    if total_bytes >= RESULT_MAX_BYTES:
+        total_msg += f" (truncated at {RESULT_MAX_BYTES:,} bytes of data)"
+    elif result_count == limit:
+        total_msg += f" (limited to {limit} rows)"
+    if compact:
+        total_msg += " in compact format"
+    
+    # Add PII masking footer if columns were masked
+    if masked_columns:
+        masked_list = ", ".join([f"{col} ({ptype})" for col, ptype in masked_columns.items()])
+        total_msg += f"\n\n[PII Masking Active] Masked columns: {masked_list}"
+    
+    return f"{table}{total_msg}"
+
+
+_FORMAT_ERROR_PREFIX = "Error formatting results"
 
 
 def format_results(cursor, limit: int = 100) -> str:
@@ -439,91 +745,194 @@ def format_results(cursor, limit: int = 100) -> str:
     Returns:
         Formatted table string with result count
     """
+    # Query and fetch errors propagate so callers don't cache them and the
+    # connection is discarded rather than returned to the pool
+    columns = tuple(map(_first, cursor.description)) if cursor.description else ()
+    
+    if not columns:
+        return "No columns returned"
+    
+    # Fetch results in chunks so oversized results stay bounded in memory
+    rows, total_bytes = _fetch_rows(cursor, limit)
+    
     try:
-        # Get column names
-        columns = [col[0] for col in cursor.description] if cursor.description else []
-        
-        if not columns:
-            return "No columns returned"
-        
-        # Fetch results
-        rows = cursor.fetchmany(limit)
-        
-        if not rows:
-            return "No results returned"
-        
-        # Convert rows to list of lists, handling special types
-        processed_rows = []
-        for row in rows:
-            processed_row = []
-            for val in row:
-                try:
-                    if val is None:
-                        processed_row.append(None)
-                    elif isinstance(val, Decimal):
-                        # Handle Decimal type (common in Trino)
-                        processed_row.append(str(val))
-                    elif hasattr(val, 'isoformat'):
-                        # Handle datetime, date, time objects
-                        processed_row.append(val.isoformat())
-                    elif isinstance(val, (bytes, bytearray)):
-                        # Handle binary data
-                        processed_row.append(f"<binary:{len(val)} bytes>")
-                    elif isinstance(val, (list, dict)):
-                        # Handle arrays and maps
-                        processed_row.append(str(val))
-                    elif isinstance(val, (int, float, str, bool)):
-                        # Handle basic types directly
-                        processed_row.append(val)
-                    else:
-                        # Handle any other types by converting to string
-                        processed_row.append(str(val))
-                except Exception as e:
-                    logger.warning(f"Error converting value {type(val)}: {e}")
-                    processed_row.append(f"<error: {type(val).__name__}>")
-            processed_rows.append(processed_row)
-        
-        # Create DataFrame for better formatting
-        df = pd.DataFrame(processed_rows, columns=columns)
-        
-        # Convert all columns to string to avoid formatting issues
-        # Replace None with empty string for tabulate compatibility
-        for col in df.columns:
-            df[col] = df[col].apply(lambda x: str(x) if x is not None else "")
-        
-        # Apply PII masking if enabled
-        masked_columns = {}
-        if PII_MASKING_ENABLED:
-            df, masked_columns = mask_pii_in_dataframe(df, columns)
-            if masked_columns:
-                logger.info(f"PII masking applied to columns: {list(masked_columns.keys())}")
-        
-        # Format as table with column width limits
-        table = tabulate(df, headers='keys', tablefmt='grid', showindex=False, maxcolwidths=50)
-        
-        result_count = len(rows)
-        total_msg = f"\n\nShowing {result_count} row(s)"
-        if result_count == limit:
-            total_msg += f" (limited to {limit} rows)"
-        
-        # Add PII masking footer if columns were masked
-        if masked_columns:
-            masked_list = ", ".join([f"{col} ({ptype})" for col, ptype in masked_columns.items()])
-            total_msg += f"\n\n[PII Masking Active] Masked columns: {masked_list}"
-        
-        return f"{table}{total_msg}"
+        return format_rows(columns, rows, limit, total_bytes)
     except Exception as e:
         import traceback
         error_trace = traceback.format_exc()
         logger.error(f"Error formatting results: {e}")
         logger.error(f"Full traceback:\n{error_trace}")
         # Return more details in error message for debugging
-        return f"Error formatting results: {str(e)}\n\nDebug info:\n{error_trace}"
+        return f"{_FORMAT_ERROR_PREFIX}: {str(e)}\n\nDebug info:\n{error_trace}"
+
+# === RESULT CACHE ===
+
+# Metadata (catalogs, schemas, tables, columns) changes rarely, so formatted
+# results are cached to skip the round trip to Trino entirely on a hit.
+_metadata_cache = TTLCache(maxsize=512, ttl=METADATA_CACHE_TTL) if METADATA_CACHE_TTL > 0 else None
+_query_cache = TTLCache(maxsize=128, ttl=QUERY_CACHE_TTL) if QUERY_CACHE_TTL > 0 else None
+_cache_lock = threading.Lock()
+
+
+def _cache_get(cache: Optional[TTLCache], key) -> Optional[str]:
+    """Look up a cached result, logging whether it was a hit or a miss."""
+    if cache is None:
+        return None
+    with _cache_lock:
+        result = cache.get(key)
+    logger.info(f"Cache {'HIT' if result is not None else 'MISS'}: {key}")
+    return result
+
+
+def _cache_put(cache: Optional[TTLCache], key, value: str) -> None:
+    """Store a result in the cache if caching is enabled and the result is not an error."""
+    if cache is None or value.startswith(_FORMAT_ERROR_PREFIX):
+        return
+    with _cache_lock:
+        cache[key] = value
+
+
+def _query_cache_key(normalized_query: str) -> str:
+    """Build a cache key for an ad-hoc query from its normalized text."""
+    return hashlib.blake2b(normalized_query.encode('utf-8'), digest_size=16).hexdigest()
+
+# === QUERY EXECUTION ===
+
+# The trino client is synchronous; blocking calls run on this bounded pool so
+# the MCP event loop stays responsive and independent tool calls overlap.
+# Sized from TRINO_POOL_SIZE so concurrent queries match reusable connections;
+# at least one worker is kept even when connection reuse is disabled.
+_QUERY_WORKERS = max(1, TRINO_POOL_SIZE)
+_query_executor = ThreadPoolExecutor(max_workers=_QUERY_WORKERS, thread_name_prefix="trino-query")
+
+
+async def _run_in_thread(func, *args):
+    """Run a blocking function on the query thread pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_query_executor, functools.partial(func, *args))
+
+
+def _sync_run_query(sql: str, limit: int) -> str:
+    """Execute a query on a pooled connection and return the formatted results."""
+    with trino_cursor() as cursor:
+        cursor.execute(sql)
+        return format_results(cursor, limit=limit)
+
+
+async def _run_query(sql: str, limit: int = 100) -> str:
+    """Execute a query off the event loop and return the formatted results."""
+    return await _run_in_thread(_sync_run_query, sql, limit)
+
+
+def _sync_fetch_rows(sql: str, limit: int) -> Tuple[tuple, list]:
+    """Execute a query on a pooled connection and return its raw (columns, rows)."""
+    with trino_cursor() as cursor:
+        cursor.execute(sql)
+        columns = tuple(map(_first, cursor.description)) if cursor.description else ()
+        rows, _ = _fetch_rows(cursor, limit)
+    return columns, rows
+
+
+class QuerySpec(NamedTuple):
+    """A query to run on behalf of a tool decorated with @trino_tool."""
+    sql: str
+    header: str  # Success message shown above the results
+    context: str  # Description of the operation for error messages
+    limit: int = 100
+    cache: Optional[TTLCache] = None
+    cache_key: Optional[str] = None  # Defaults to the SQL text
+
+
+def trino_tool(fn):
+    """
+    Turn a function that builds a QuerySpec into an async MCP tool.
+    
+    The decorated function validates its arguments and returns either a
+    QuerySpec or an error message string. The wrapper handles caching,
+    running the query off the event loop, formatting and error reporting,
+    so every query-backed tool shares the same code path. A ValueError
+    raised while building the spec (e.g. from _q) is reported as an error.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs) -> str:
+        try:
+            spec = fn(*args, **kwargs)
+        except ValueError as e:
+            return f"❌ Error: {e}"
+        if isinstance(spec, str):
+            return spec
+        
+        try:
+            cache_key = spec.cache_key or spec.sql
+            result = _cache_get(spec.cache, cache_key)
+            if result is None:
+                result = await _run_query(spec.sql, limit=spec.limit)
+                _cache_put(spec.cache, cache_key, result)
+            
+            return f"✅ {spec.header}\n\n{result}"
+        except Exception as e:
+            logger.error(f"Error in {fn.__name__}: {e}")
+            return format_error_message(e, spec.context)
+    
+    # MCP reads the tool's parameters from the signature; the tool returns text
+    wrapper.__signature__ = inspect.signature(fn).replace(return_annotation=str)
+    return wrapper
+
+
+def _stats_row_count(columns: tuple, rows: list) -> Optional[int]:
+    """Extract the table row count from SHOW STATS output, if the connector provides it."""
+    if 'column_name' not in columns or 'row_count' not in columns:
+        return None
+    name_idx = columns.index('column_name')
+    count_idx = columns.index('row_count')
+    for row in rows:
+        # The table-level summary row has no column name
+        if row[name_idx] is None and row[count_idx] is not None:
+            return int(row[count_idx])
+    return None
+
+
+def _sync_table_stats(table_ref: str) -> Tuple[int, bool, str]:
+    """
+    Fetch the row count and formatted column statistics for a table.
+    
+    Returns:
+        Tuple of (row_count, from_statistics, stats_result)
+    """
+    with trino_cursor() as cursor:
+        # Column statistics usually include the row count as well
+        cursor.execute(f"SHOW STATS FOR {table_ref}")
+        columns = tuple(map(_first, cursor.description)) if cursor.description else ()
+        rows, total_bytes = _fetch_rows(cursor, 1000)
+        row_count = _stats_row_count(columns, rows)
+        from_statistics = row_count is not None
+        
+        # Only scan the table when the connector has no row count statistic
+        if not from_statistics:
+            cursor.execute(f"SELECT COUNT(*) as row_count FROM {table_ref}")
+            count_result = cursor.fetchone()
+            row_count = count_result[0] if count_result else 0
+    
+    stats_result = format_rows(columns, rows, 1000, total_bytes) if columns else "No columns returned"
+    return row_count, from_statistics, stats_result
+
+
+def _sync_server_version() -> str:
+    """Fetch the Trino server version, verifying a query round trip in the same call."""
+    with trino_cursor() as cursor:
+        # Server version and a trivial test value in a single query
+        cursor.execute("SELECT version() AS version, 1 AS test")
+        row = cursor.fetchone()
+    
+    if not row or row[1] != 1:
+        raise Exception("Test query returned an unexpected result")
+    return row[0] if row[0] is not None else "Unknown"
 
 # === MCP TOOLS ===
 
 @mcp.tool()
-async def execute_query(query: str = "") -> str:
+@trino_tool
+def execute_query(query: str = "") -> Union[QuerySpec, str]:
     """Execute a read-only SQL query on Trino (SELECT, SHOW, DESCRIBE only)."""
     logger.info(f"Executing query: {query[:100]}...")
     
@@ -531,142 +940,146 @@ async def execute_query(query: str = "") -> str:
         return "❌ Error: Query is required"
     
     # Validate query is read-only
-    if not validate_query(query):
+    is_valid, normalized = validate_query(query)
+    if not is_valid:
         return "❌ Error: Only read-only queries are allowed (SELECT, SHOW, DESCRIBE, EXPLAIN, WITH)"
     
-    try:
-        conn = get_trino_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(query)
-        result = format_results(cursor)
-        
-        cursor.close()
-        conn.close()
-        
-        return f"✅ Query executed successfully:\n\n{result}"
-    except Exception as e:
-        logger.error(f"Query execution error: {e}")
-        return format_error_message(e, f"Executing query: {query[:100]}...")
+    # Ambiguous (unbalanced) queries are keyed on their exact text
+    key_text = normalized if normalized is not None else query.strip()
+    
+    return QuerySpec(
+        sql=apply_row_limit(query, normalized),
+        header="Query executed successfully:",
+        context=f"Executing query: {query[:100]}...",
+        limit=QUERY_ROW_LIMIT,
+        # EXPLAIN output reflects the current plan and statistics, so never cache it
+        cache=None if key_text.upper().startswith('EXPLAIN') else _query_cache,
+        cache_key=_query_cache_key(key_text),
+    )
 
 @mcp.tool()
-async def show_catalogs() -> str:
+@trino_tool
+def show_catalogs() -> Union[QuerySpec, str]:
     """Show all available catalogs in Trino."""
     logger.info("Showing catalogs")
     
-    try:
-        conn = get_trino_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("SHOW CATALOGS")
-        result = format_results(cursor)
-        
-        cursor.close()
-        conn.close()
-        
-        return f"✅ Available catalogs:\n\n{result}"
-    except Exception as e:
-        logger.error(f"Error showing catalogs: {e}")
-        return format_error_message(e, "Showing catalogs")
+    return QuerySpec("SHOW CATALOGS", "Available catalogs:", "Showing catalogs", cache=_metadata_cache)
 
 @mcp.tool()
-async def show_schemas(catalog: str = "") -> str:
+@trino_tool
+def show_schemas(catalog: str = "") -> Union[QuerySpec, str]:
     """Show all schemas in a specific catalog or current catalog."""
     catalog_name = catalog.strip() or TRINO_CATALOG
     logger.info(f"Showing schemas in catalog: {catalog_name}")
     
-    try:
-        conn = get_trino_connection()
-        cursor = conn.cursor()
-        
-        query = f"SHOW SCHEMAS FROM {catalog_name}" if catalog.strip() else "SHOW SCHEMAS"
-        cursor.execute(query)
-        result = format_results(cursor)
-        
-        cursor.close()
-        conn.close()
-        
-        return f"✅ Schemas in {catalog_name}:\n\n{result}"
-    except Exception as e:
-        logger.error(f"Error showing schemas: {e}")
-        return format_error_message(e, f"Showing schemas in catalog: {catalog_name}")
+    return QuerySpec(
+        f"SHOW SCHEMAS FROM {_q(catalog_name)}",
+        f"Schemas in {catalog_name}:",
+        f"Showing schemas in catalog: {catalog_name}",
+        cache=_metadata_cache,
+    )
 
 @mcp.tool()
-async def show_tables(schema: str = "", catalog: str = "") -> str:
+@trino_tool
+def show_tables(schema: str = "", catalog: str = "") -> Union[QuerySpec, str]:
     """Show all tables in a schema."""
     catalog_name = catalog.strip() or TRINO_CATALOG
     schema_name = schema.strip() or TRINO_SCHEMA
     logger.info(f"Showing tables in {catalog_name}.{schema_name}")
     
-    try:
-        conn = get_trino_connection()
-        cursor = conn.cursor()
-        
-        query = f"SHOW TABLES FROM {catalog_name}.{schema_name}"
-        cursor.execute(query)
-        result = format_results(cursor)
-        
-        cursor.close()
-        conn.close()
-        
-        return f"✅ Tables in {catalog_name}.{schema_name}:\n\n{result}"
-    except Exception as e:
-        logger.error(f"Error showing tables: {e}")
-        return format_error_message(e, f"Showing tables in {catalog_name}.{schema_name}")
+    return QuerySpec(
+        f"SHOW TABLES FROM {_qualified_name(catalog_name, schema_name)}",
+        f"Tables in {catalog_name}.{schema_name}:",
+        f"Showing tables in {catalog_name}.{schema_name}",
+        cache=_metadata_cache,
+    )
 
 @mcp.tool()
-async def describe_table(table: str = "", schema: str = "", catalog: str = "") -> str:
+@trino_tool
+def describe_table(table: str = "", schema: str = "", catalog: str = "") -> Union[QuerySpec, str]:
     """Describe the structure of a table including columns and their types."""
     if not table.strip():
         return "❌ Error: Table name is required"
     
     catalog_name = catalog.strip() or TRINO_CATALOG
     schema_name = schema.strip() or TRINO_SCHEMA
-    full_table = f"{catalog_name}.{schema_name}.{table}"
+    full_table = f"{catalog_name}.{schema_name}.{table.strip()}"
+    table_ref = _qualified_name(catalog_name, schema_name, table.strip())
     
     logger.info(f"Describing table: {full_table}")
     
-    try:
-        conn = get_trino_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(f"DESCRIBE {full_table}")
-        result = format_results(cursor, limit=1000)
-        
-        cursor.close()
-        conn.close()
-        
-        return f"✅ Structure of {full_table}:\n\n{result}"
-    except Exception as e:
-        logger.error(f"Error describing table: {e}")
-        return format_error_message(e, f"Describing table: {full_table}")
+    return QuerySpec(
+        f"DESCRIBE {table_ref}",
+        f"Structure of {full_table}:",
+        f"Describing table: {full_table}",
+        limit=1000,
+        cache=_metadata_cache,
+    )
 
 @mcp.tool()
-async def show_columns(table: str = "", schema: str = "", catalog: str = "") -> str:
+@trino_tool
+def show_columns(table: str = "", schema: str = "", catalog: str = "") -> Union[QuerySpec, str]:
     """Show columns of a specific table with detailed information."""
     if not table.strip():
         return "❌ Error: Table name is required"
     
     catalog_name = catalog.strip() or TRINO_CATALOG
     schema_name = schema.strip() or TRINO_SCHEMA
-    full_table = f"{catalog_name}.{schema_name}.{table}"
+    full_table = f"{catalog_name}.{schema_name}.{table.strip()}"
+    table_ref = _qualified_name(catalog_name, schema_name, table.strip())
     
     logger.info(f"Showing columns for: {full_table}")
     
+    return QuerySpec(
+        f"SHOW COLUMNS FROM {table_ref}",
+        f"Columns in {full_table}:",
+        f"Showing columns for: {full_table}",
+        limit=1000,
+        cache=_metadata_cache,
+    )
+
+@mcp.tool()
+async def list_all(catalog: str = "") -> str:
+    """List every table in every schema of a catalog (excluding information_schema)."""
+    catalog_name = catalog.strip() or TRINO_CATALOG
+    logger.info(f"Listing all tables in catalog: {catalog_name}")
+    
     try:
-        conn = get_trino_connection()
-        cursor = conn.cursor()
+        catalog_ref = _q(catalog_name)
+    except ValueError as e:
+        return f"❌ Error: {e}"
+    
+    # Bound concurrent SHOW TABLES queries so large catalogs don't flood the coordinator
+    semaphore = asyncio.Semaphore(_QUERY_WORKERS)
+    skipped = []
+    
+    async def list_tables(schema_name: str) -> list:
+        async with semaphore:
+            try:
+                _, rows = await _run_in_thread(
+                    _sync_fetch_rows, f"SHOW TABLES FROM {catalog_ref}.{_quote_identifier(schema_name)}", 1000
+                )
+            except Exception as e:
+                logger.warning(f"Skipping schema {schema_name}: {e}")
+                skipped.append(schema_name)
+                return []
+        return [(schema_name, row[0]) for row in rows]
+    
+    try:
+        _, schema_rows = await _run_in_thread(_sync_fetch_rows, f"SHOW SCHEMAS FROM {catalog_ref}", 1000)
+        schemas = [row[0] for row in schema_rows if row[0] != 'information_schema']
         
-        cursor.execute(f"SHOW COLUMNS FROM {full_table}")
-        result = format_results(cursor, limit=1000)
+        results = await asyncio.gather(*(list_tables(schema_name) for schema_name in schemas))
+        rows = [row for schema_tables in results for row in schema_tables]
         
-        cursor.close()
-        conn.close()
+        result = format_rows(("Schema", "Table"), rows[:1000], limit=1000)
+        if skipped:
+            result += f"\n\nSkipped schemas (query failed): {', '.join(sorted(skipped))}"
         
-        return f"✅ Columns in {full_table}:\n\n{result}"
+        return f"✅ Tables in {len(schemas)} schema(s) of {catalog_name}:\n\n{result}"
     except Exception as e:
-        logger.error(f"Error showing columns: {e}")
-        return format_error_message(e, f"Showing columns for: {full_table}")
+        logger.error(f"Error listing tables: {e}")
+        return format_error_message(e, f"Listing all tables in catalog: {catalog_name}")
 
 @mcp.tool()
 async def get_table_stats(table: str = "", schema: str = "", catalog: str = "") -> str:
@@ -676,29 +1089,22 @@ async def get_table_stats(table: str = "", schema: str = "", catalog: str = "")
     
     catalog_name = catalog.strip() or TRINO_CATALOG
     schema_name = schema.strip() or TRINO_SCHEMA
-    full_table = f"{catalog_name}.{schema_name}.{table}"
+    full_table = f"{catalog_name}.{schema_name}.{table.strip()}"
+    
+    try:
+        table_ref = _qualified_name(catalog_name, schema_name, table.strip())
+    except ValueError as e:
+        return f"❌ Error: {e}"
     
     logger.info(f"Getting stats for: {full_table}")
     
     try:
-        conn = get_trino_connection()
-        cursor = conn.cursor()
-        
-        # Get row count
-        cursor.execute(f"SELECT COUNT(*) as row_count FROM {full_table}")
-        count_result = cursor.fetchone()
-        row_count = count_result[0] if count_result else 0
-        
-        # Get table properties if available
-        cursor.execute(f"SHOW STATS FOR {full_table}")
-        stats_result = format_results(cursor, limit=1000)
-        
-        cursor.close()
-        conn.close()
+        row_count, from_statistics, stats_result = await _run_in_thread(_sync_table_stats, table_ref)
+        count_note = " (from table statistics)" if from_statistics else ""
         
         return f"""✅ Statistics for {full_table}:
 
-📊 Total Rows: {row_count:,}
+📊 Total Rows: {row_count:,}{count_note}
 
 📈 Column Statistics:
 {stats_result}"""
@@ -707,38 +1113,31 @@ async def get_table_stats(table: str = "", schema: str = "", catalog: str = "")
         return format_error_message(e, f"Getting stats for: {full_table}")
 
 @mcp.tool()
-async def sample_table(table: str = "", limit: str = "10", schema: str = "", catalog: str = "") -> str:
+@trino_tool
+def sample_table(table: str = "", limit: str = "10", schema: str = "", catalog: str = "") -> Union[QuerySpec, str]:
     """Get a sample of rows from a table."""
     if not table.strip():
         return "❌ Error: Table name is required"
     
     catalog_name = catalog.strip() or TRINO_CATALOG
     schema_name = schema.strip() or TRINO_SCHEMA
-    full_table = f"{catalog_name}.{schema_name}.{table}"
+    full_table = f"{catalog_name}.{schema_name}.{table.strip()}"
+    table_ref = _qualified_name(catalog_name, schema_name, table.strip())
     
     try:
-        limit_int = int(limit) if limit.strip() else 10
-        if limit_int > 100:
-            limit_int = 100
+        limit_int = int(limit.strip(), 10) if limit.strip() else 10
+        limit_int = max(1, min(limit_int, 100))
     except ValueError:
         return f"❌ Error: Invalid limit value: {limit}"
     
     logger.info(f"Sampling {limit_int} rows from: {full_table}")
     
-    try:
-        conn = get_trino_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(f"SELECT * FROM {full_table} LIMIT {limit_int}")
-        result = format_results(cursor, limit=limit_int)
-        
-        cursor.close()
-        conn.close()
-        
-        return f"✅ Sample from {full_table}:\n\n{result}"
-    except Exception as e:
-        logger.error(f"Error sampling table: {e}")
-        return format_error_message(e, f"Sampling table: {full_table}")
+    return QuerySpec(
+        f"SELECT * FROM {table_ref} LIMIT {limit_int}",
+        f"Sample from {full_table}:",
+        f"Sampling table: {full_table}",
+        limit=limit_int,
+    )
 
 @mcp.tool()
 async def test_connection() -> str:
@@ -754,23 +1153,7 @@ async def test_connection() -> str:
     logger.info("Testing Trino connection")
     
     try:
-        conn = get_trino_connection()
-        cursor = conn.cursor()
-        
-        # Get server version/info
-        try:
-            cursor.execute("SELECT version()")
-            version_result = cursor.fetchone()
-            version = version_result[0] if version_result else "Unknown"
-        except Exception:
-            version = "Unable to retrieve version"
-        
-        # Test a simple query
-        cursor.execute("SELECT 1 as test")
-        test_result = cursor.fetchone()
-        
-        cursor.close()
-        conn.close()
+        version = await _run_in_thread(_sync_server_version)
         
         return f"""✅ Connection Test Successful!
 
@@ -789,6 +1172,79 @@ async def test_connection() -> str:
         logger.error(f"Connection test failed: {e}")
         return format_error_message(e, "Testing connection")
 
+# Metadata cache keys are the SQL issued by the metadata tools; the quoted
+# catalog/schema/table reference follows one of these prefixes
+_METADATA_KEY_PREFIXES = ("SHOW SCHEMAS FROM ", "SHOW TABLES FROM ", "SHOW COLUMNS FROM ", "DESCRIBE ")
+
+
+def _metadata_key_target(key: str) -> Optional[str]:
+    """Return the quoted object reference a metadata cache key is about, if any."""
+    for prefix in _METADATA_KEY_PREFIXES:
+        if key.startswith(prefix):
+            return key[len(prefix):]
+    return None
+
+
+@mcp.tool()
+async def invalidate_cache(table: str = "", schema: str = "", catalog: str = "") -> str:
+    """
+    Clear cached results, optionally only metadata for a catalog, schema or table.
+    
+    With no arguments every cache is cleared. Otherwise metadata listings for the
+    most specific object given (table, then schema, then catalog) are dropped,
+    along with the listing that contains it. Ad-hoc query results are cached by
+    hash and cannot be attributed to a table, so they are always cleared.
+    """
+    table_name = table.strip()
+    schema_name = schema.strip()
+    catalog_name = catalog.strip()
+    scoped = bool(table_name or schema_name or catalog_name)
+    scope = scope_ref = parent_key = None
+    
+    try:
+        if table_name:
+            catalog_name = catalog_name or TRINO_CATALOG
+            schema_name = schema_name or TRINO_SCHEMA
+            scope = f"{catalog_name}.{schema_name}.{table_name}"
+            scope_ref = _qualified_name(catalog_name, schema_name, table_name)
+            parent_key = f"SHOW TABLES FROM {_qualified_name(catalog_name, schema_name)}"
+        elif schema_name:
+            catalog_name = catalog_name or TRINO_CATALOG
+            scope = f"{catalog_name}.{schema_name}"
+            scope_ref = _qualified_name(catalog_name, schema_name)
+            parent_key = f"SHOW SCHEMAS FROM {_q(catalog_name)}"
+        elif catalog_name:
+            scope = catalog_name
+            scope_ref = _q(catalog_name)
+            parent_key = None
+    except ValueError as e:
+        return f"❌ Error: {e}"
+    
+    def is_stale(key) -> bool:
+        if not scoped:
+            return True
+        if key == parent_key:
+            return True
+        target = _metadata_key_target(key)
+        # Embedded quotes are doubled, so a quoted prefix followed by '.' matches whole parts only
+        return target is not None and (target == scope_ref or target.startswith(scope_ref + "."))
+    
+    with _cache_lock:
+        metadata_removed = 0
+        if _metadata_cache is not None:
+            stale = [key for key in _metadata_cache if is_stale(key)]
+            for key in stale:
+                _metadata_cache.pop(key, None)
+            metadata_removed = len(stale)
+        query_removed = 0
+        if _query_cache is not None:
+            query_removed = len(_query_cache)
+            _query_cache.clear()
+    
+    target = f" for {scope}" if scoped else ""
+    logger.info(f"Invalidated {metadata_removed} metadata and {query_removed} query result(s){target}")
+    return f"✅ Cleared {metadata_removed} cached metadata result(s){target} and {query_removed} cached query result(s)"
+
 # === SERVER STARTUP ===
 if __name__ == "__main__":
     logger.info("Starting Trino MCP server...")
@@ -799,6 +1255,11 @@ if __name__ == "__main__":
     logger.info(f"  Schema: {TRINO_SCHEMA}")
     logger.info(f"  Authentication: {'Enabled' if TRINO_PASSWORD else 'Disabled'}")
     logger.info(f"  Protocol: {'HTTPS' if TRINO_USE_HTTPS else 'HTTP'}")
+    logger.info(f"  Connection Pool Size: {TRINO_POOL_SIZE}")
+    logger.info(f"  Metadata Cache TTL: {METADATA_CACHE_TTL}s")
+    logger.info(f"  Query Cache TTL: {QUERY_CACHE_TTL}s")
+    logger.info(f"  Result Byte Limit: {RESULT_MAX_BYTES}")
+    logger.info(f"  Compact Format Above: {RESULT_COMPACT_BYTES} bytes")
     logger.info(f"  Log Level: {LOG_LEVEL}")
     logger.info(f"PII Masking Configuration:")
     logger.info(f"  Enabled: {PII_MASKING_ENABLED}")
@@ -818,8 +1279,8 @@ if __name__ == "__main__":
     
     # Test connection on startup (non-blocking)
     try:
-        conn = get_trino_connection()
-        conn.close()
+        with trino_conn():
+            pass
         logger.info("✅ Successfully connected to Trino")
     except Exception as e:
         logger.warning(f"⚠️ Could not connect to Trino on startup: {e}")